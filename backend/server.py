@@ -1,32 +1,65 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, ReturnDocument, UpdateOne
+from bson.codec_options import CodecOptions, TypeEncoder, TypeRegistry
+import asyncio
+import hashlib
 import os
 import logging
+import time
+import orjson
+from cachetools import TTLCache
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timezone, timedelta
 from datetime import date as DateType
-from emergentintegrations.llm.chat import LlmChat, UserMessage
-import json
+import httpx
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Environment-backed configuration, bound once at import
+GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
+CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
+
+class _DateEncoder(TypeEncoder):
+    """Encode plain dates as midnight-UTC BSON Dates at the driver layer
+
+    Encode-only on purpose: a decode-side codec would apply to every BSON
+    Date and turn created_at/updated_at into plain dates as well.
+    """
+    python_type = DateType
+
+    def transform_python(self, value):
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+client = AsyncMongoClient(mongo_url, maxPoolSize=20, minPoolSize=5)
+db = client.get_database(
+    os.environ['DB_NAME'],
+    codec_options=CodecOptions(tz_aware=True, type_registry=TypeRegistry([_DateEncoder()]))
+)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, skipping FastAPI's jsonable_encoder"""
+    def render(self, content):
+        return orjson.dumps(content, default=str, option=orjson.OPT_NAIVE_UTC)
 
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+def _now(_n=datetime.now, _utc=timezone.utc) -> datetime:
+    """Current UTC time, with the attribute lookups bound once at import"""
+    return _n(_utc)
+
 # Define Models
 class JournalEntryCreate(BaseModel):
     title: str
@@ -41,9 +74,13 @@ class JournalEntry(BaseModel):
     mood_score: Optional[int] = None
     mood_emotion: Optional[str] = None
     ai_summary: Optional[str] = None
-    date: DateType = Field(default_factory=lambda: datetime.now(timezone.utc).date())
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    date: DateType = Field(default_factory=lambda: _now().date())
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
+
+# Schema compiled once at import; dump_json then loops in Rust instead of
+# serializing each model from Python
+ENTRIES_ADAPTER = TypeAdapter(List[JournalEntry])
 
 class MoodTrendData(BaseModel):
     date: str
@@ -56,33 +93,62 @@ class WeeklyMoodStats(BaseModel):
     most_common_emotion: str
     total_entries: int
 
-# Helper functions for MongoDB serialization
-def prepare_for_mongo(data):
-    if isinstance(data.get('date'), DateType):
-        data['date'] = data['date'].isoformat()
-    if isinstance(data.get('created_at'), datetime):
-        data['created_at'] = data['created_at'].isoformat()
-    if isinstance(data.get('updated_at'), datetime):
-        data['updated_at'] = data['updated_at'].isoformat()
-    return data
-
-def parse_from_mongo(item):
-    if isinstance(item.get('date'), str):
-        item['date'] = datetime.fromisoformat(item['date']).date()
-    if isinstance(item.get('created_at'), str):
-        item['created_at'] = datetime.fromisoformat(item['created_at'])
-    if isinstance(item.get('updated_at'), str):
-        item['updated_at'] = datetime.fromisoformat(item['updated_at'])
-    return item
+# Helper functions for MongoDB documents
+# Collection change stamp backing the read-endpoint ETags, refreshed at most
+# once per second so cache hits cost no database round trip
+_etag_state = {"stamp": None, "checked_at": 0.0}
 
-# AI Analysis Function
-async def analyze_mood_and_summarize(content: str, title: str):
-    """Analyze journal entry for mood and generate summary using Gemini LLM"""
-    try:
-        genai.configure(api_key=os.environ.get('GEMINI_API_KEY'))
-        model = genai.GenerativeModel(
-            model_name="gemini-pro",
-            system_instruction="""You are a mood analysis expert. Analyze the given journal entry and provide:
+async def _collection_etag(extra: str = "") -> str:
+    now = time.monotonic()
+    if _etag_state["stamp"] is None or now - _etag_state["checked_at"] > 1.0:
+        latest, count = await asyncio.gather(
+            db.journal_entries.find_one(
+                {}, sort=[("updated_at", -1)], projection={"_id": 0, "updated_at": 1}
+            ),
+            db.journal_entries.estimated_document_count(),
+        )
+        stamp = latest["updated_at"] if latest else "empty"
+        if isinstance(stamp, datetime):
+            stamp = stamp.isoformat()
+        # The count makes deletes move the stamp even though they touch no
+        # updated_at value
+        _etag_state["stamp"] = f"{stamp}:{count}"
+        _etag_state["checked_at"] = now
+    return f'W/"{_etag_state["stamp"]}{extra}"'
+
+def _invalidate_collection_etag():
+    """Drop the memoized stamp after a write so the next read revalidates
+
+    Without this, a conditional GET within the 1s refresh window would be
+    answered 304 against the pre-write validator.
+    """
+    _etag_state["stamp"] = None
+
+async def _adjust_tag_counts(added, removed=()):
+    """Keep the precomputed tags collection in sync with entry writes"""
+    ops = [UpdateOne({"_id": tag}, {"$inc": {"count": 1}}, upsert=True) for tag in added]
+    # Decrements are floored at zero so a counter that drifted low (e.g. a
+    # missed backfill) can't go negative and hide a tag forever
+    ops += [
+        UpdateOne(
+            {"_id": tag},
+            [{"$set": {"count": {"$max": [0, {"$subtract": [{"$ifNull": ["$count", 1]}, 1]}]}}}]
+        )
+        for tag in removed
+    ]
+    if ops:
+        await db.tags.bulk_write(ops, ordered=False)
+
+def _shape(doc):
+    """Strip Mongo-internal fields so a raw document can be returned as-is"""
+    doc.pop('_id', None)
+    if isinstance(doc.get('date'), datetime):
+        doc['date'] = doc['date'].date()
+    return doc
+
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent"
+
+MOOD_ANALYSIS_INSTRUCTION = """You are a mood analysis expert. Analyze the given journal entry and provide:
 1. A mood score from 1-10 (where 1 is very negative/sad, 10 is very positive/happy)
 2. A primary emotion category (happy, sad, anxious, excited, calm, angry, grateful, stressed, content, melancholy)
 3. A brief 2-3 sentence summary of the entry
@@ -94,21 +160,54 @@ Respond in this exact JSON format:
     "summary": "Brief summary here"
 }
 """
-        )
 
+# Shared HTTP client: keep-alive skips per-request TLS setup, and the async
+# transport yields to the event loop during network waits
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=20,
+    limits=httpx.Limits(max_keepalive_connections=50)
+)
+
+# Memoized LLM analyses; a cache hit skips the Gemini round trip entirely
+_analysis_cache = TTLCache(maxsize=10_000, ttl=86400)
+
+def _analysis_key(title: str, content: str) -> str:
+    return hashlib.blake2b(f"{title}\0{content}".encode(), digest_size=16).hexdigest()
+
+# AI Analysis Function
+async def analyze_mood_and_summarize(content: str, title: str):
+    """Analyze journal entry for mood and generate summary using Gemini LLM"""
+    cache_key = _analysis_key(title, content)
+    cached = _analysis_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    try:
         user_message = f"Title: {title}\n\nContent: {content}\n\nPlease analyze this journal entry for mood and provide a summary."
 
-        response = await model.generate_content_async(user_message)
+        response = await http_client.post(
+            GEMINI_API_URL,
+            params={"key": GEMINI_API_KEY},
+            json={
+                "system_instruction": {"parts": [{"text": MOOD_ANALYSIS_INSTRUCTION}]},
+                "contents": [{"parts": [{"text": user_message}]}]
+            }
+        )
+        response.raise_for_status()
+        analysis_text = response.json()["candidates"][0]["content"]["parts"][0]["text"]
 
         # Parse the JSON response
         try:
-            analysis = json.loads(response.text.strip())
-            return {
+            analysis = orjson.loads(analysis_text)
+            result = {
                 "mood_score": analysis.get("mood_score", 5),
                 "mood_emotion": analysis.get("mood_emotion", "neutral"),
                 "ai_summary": analysis.get("summary", "No summary available")
             }
-        except json.JSONDecodeError:
+            # Only cache real analyses, never the fallback values below
+            _analysis_cache[cache_key] = result
+            return result
+        except orjson.JSONDecodeError:
             # Fallback if JSON parsing fails
             return {
                 "mood_score": 5,
@@ -129,66 +228,166 @@ Respond in this exact JSON format:
 async def root():
     return {"message": "Journal App API"}
 
-@api_router.post("/entries", response_model=JournalEntry)
+@api_router.post("/entries")
 async def create_entry(entry_data: JournalEntryCreate):
     """Create a new journal entry with AI mood analysis"""
     try:
-        # Get AI analysis
-        ai_analysis = await analyze_mood_and_summarize(entry_data.content, entry_data.title)
-        
+        # Kick off AI analysis and overlap it with the initial insert
+        ai_task = asyncio.create_task(analyze_mood_and_summarize(entry_data.content, entry_data.title))
+
         # Create entry object
         entry = JournalEntry(
             title=entry_data.title,
             content=entry_data.content,
-            tags=entry_data.tags,
-            mood_score=ai_analysis["mood_score"],
-            mood_emotion=ai_analysis["mood_emotion"],
-            ai_summary=ai_analysis["ai_summary"]
+            tags=entry_data.tags
         )
-        
-        # Prepare for MongoDB
-        entry_dict = prepare_for_mongo(entry.dict())
-        
-        # Insert into database
+
+        # The driver's codec encodes date/datetime to BSON Dates natively; the
+        # unanalyzed AI fields are left out and patched in by the $set below
+        entry_dict = entry.model_dump(mode="python", exclude_none=True)
+
+        # Insert into database while the LLM call is in flight
         await db.journal_entries.insert_one(entry_dict)
-        
-        return entry
-        
+        await _adjust_tag_counts(entry.tags)
+
+        # Patch in the AI fields once the analysis lands
+        ai_analysis = await ai_task
+        entry.mood_score = ai_analysis["mood_score"]
+        entry.mood_emotion = ai_analysis["mood_emotion"]
+        entry.ai_summary = ai_analysis["ai_summary"]
+        await db.journal_entries.update_one({"id": entry.id}, {"$set": ai_analysis})
+        _invalidate_collection_etag()
+
+        return ORJSONResponse(
+            entry.model_dump(mode="json"),
+            status_code=201,
+            headers={"Location": f"/api/entries/{entry.id}"}
+        )
+
     except Exception as e:
         logging.error(f"Error creating entry: {e}")
         raise HTTPException(status_code=500, detail="Failed to create journal entry")
 
-@api_router.get("/entries", response_model=List[JournalEntry])
-async def get_entries(limit: int = 50, skip: int = 0):
-    """Get journal entries, sorted by most recent first"""
+@api_router.post("/entries/bulk")
+async def create_entries_bulk(items: List[JournalEntryCreate]):
+    """Create multiple journal entries in one request with concurrent AI analysis"""
+    if not items:
+        return ORJSONResponse([])
+    try:
+        # Cap concurrent LLM calls; the inserts then go out as one batch
+        sem = asyncio.Semaphore(10)
+
+        async def analyze(item):
+            async with sem:
+                return await analyze_mood_and_summarize(item.content, item.title)
+
+        analyses = await asyncio.gather(*(analyze(item) for item in items))
+
+        entries = []
+        docs = []
+        for item, ai_analysis in zip(items, analyses):
+            entry = JournalEntry(
+                title=item.title,
+                content=item.content,
+                tags=item.tags,
+                mood_score=ai_analysis["mood_score"],
+                mood_emotion=ai_analysis["mood_emotion"],
+                ai_summary=ai_analysis["ai_summary"]
+            )
+            doc = entry.model_dump(mode="python", exclude_none=True)
+            entries.append(entry)
+            docs.append(doc)
+
+        # One round trip to Mongo instead of one insert per entry
+        await db.journal_entries.insert_many(docs, ordered=False)
+        await _adjust_tag_counts([tag for entry in entries for tag in entry.tags])
+        _invalidate_collection_etag()
+
+        return Response(ENTRIES_ADAPTER.dump_json(entries), media_type="application/json")
+
+    except Exception as e:
+        logging.error(f"Error creating entries in bulk: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create journal entries")
+
+@api_router.get("/entries")
+async def get_entries(request: Request, limit: int = 50, skip: int = 0, fields: Optional[str] = None):
+    """Get journal entries, sorted by most recent first
+
+    `fields` optionally narrows documents to a comma-separated list of field
+    names (e.g. `title,date,mood_score` for list card views), skipping the
+    transfer and decode of full entry content.
+    """
     try:
-        entries = await db.journal_entries.find().sort("created_at", -1).skip(skip).limit(limit).to_list(length=limit)
-        return [JournalEntry(**parse_from_mongo(entry)) for entry in entries]
+        etag = await _collection_etag()
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+
+        projection = {"_id": 0}
+        if fields:
+            projection.update({field: 1 for field in fields.split(",") if field})
+            projection["id"] = 1
+        cursor = db.journal_entries.find({}, projection=projection).sort("created_at", -1).skip(skip).limit(limit)
+
+        # Serialize entries as the cursor yields them: constant memory instead
+        # of buffering the whole page, and first bytes go out immediately
+        async def stream():
+            yield b"["
+            first = True
+            async for entry in cursor:
+                if not first:
+                    yield b","
+                first = False
+                yield orjson.dumps(_shape(entry), default=str)
+            yield b"]"
+
+        return StreamingResponse(stream(), media_type="application/json", headers={"ETag": etag})
     except Exception as e:
         logging.error(f"Error fetching entries: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch entries")
 
-@api_router.get("/entries/{entry_id}", response_model=JournalEntry)
-async def get_entry(entry_id: str):
+@api_router.get("/entries/{entry_id}")
+async def get_entry(entry_id: str, request: Request):
     """Get a specific journal entry"""
     try:
+        # Existence first, so a deleted entry turns into a 404 rather than a
+        # 304 against a stale validator
         entry = await db.journal_entries.find_one({"id": entry_id})
         if not entry:
             raise HTTPException(status_code=404, detail="Entry not found")
-        return JournalEntry(**parse_from_mongo(entry))
+
+        etag = await _collection_etag()
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        return ORJSONResponse(_shape(entry), headers={"ETag": etag})
     except HTTPException:
         raise
     except Exception as e:
         logging.error(f"Error fetching entry: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch entry")
 
-@api_router.put("/entries/{entry_id}", response_model=JournalEntry)
+@api_router.put("/entries/{entry_id}")
 async def update_entry(entry_id: str, entry_data: JournalEntryCreate):
     """Update a journal entry and re-analyze mood"""
     try:
-        # Get AI analysis for updated content
-        ai_analysis = await analyze_mood_and_summarize(entry_data.content, entry_data.title)
-        
+        # Overlap the AI analysis with fetching the current document
+        ai_task = asyncio.create_task(analyze_mood_and_summarize(entry_data.content, entry_data.title))
+
+        existing = await db.journal_entries.find_one({"id": entry_id})
+        if not existing:
+            ai_task.cancel()
+            raise HTTPException(status_code=404, detail="Entry not found")
+
+        if existing["title"] == entry_data.title and existing["content"] == entry_data.content:
+            # Content unchanged (e.g. tags-only edit); reuse the stored analysis
+            ai_task.cancel()
+            ai_analysis = {
+                "mood_score": existing.get("mood_score"),
+                "mood_emotion": existing.get("mood_emotion"),
+                "ai_summary": existing.get("ai_summary")
+            }
+        else:
+            ai_analysis = await ai_task
+
         # Update data
         update_data = {
             "title": entry_data.title,
@@ -197,21 +396,25 @@ async def update_entry(entry_id: str, entry_data: JournalEntryCreate):
             "mood_score": ai_analysis["mood_score"],
             "mood_emotion": ai_analysis["mood_emotion"],
             "ai_summary": ai_analysis["ai_summary"],
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "updated_at": datetime.now(timezone.utc)
         }
         
-        # Update in database
-        result = await db.journal_entries.update_one(
+        # Update and fetch the new document in one round trip
+        updated_entry = await db.journal_entries.find_one_and_update(
             {"id": entry_id},
-            {"$set": update_data}
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
         )
-        
-        if result.matched_count == 0:
+
+        if not updated_entry:
             raise HTTPException(status_code=404, detail="Entry not found")
-        
-        # Return updated entry
-        updated_entry = await db.journal_entries.find_one({"id": entry_id})
-        return JournalEntry(**parse_from_mongo(updated_entry))
+
+        old_tags = set(existing.get("tags") or ())
+        new_tags = set(entry_data.tags)
+        await _adjust_tag_counts(new_tags - old_tags, old_tags - new_tags)
+        _invalidate_collection_etag()
+
+        return ORJSONResponse(_shape(updated_entry))
         
     except HTTPException:
         raise
@@ -223,9 +426,13 @@ async def update_entry(entry_id: str, entry_data: JournalEntryCreate):
 async def delete_entry(entry_id: str):
     """Delete a journal entry"""
     try:
-        result = await db.journal_entries.delete_one({"id": entry_id})
-        if result.deleted_count == 0:
+        deleted = await db.journal_entries.find_one_and_delete(
+            {"id": entry_id}, projection={"tags": 1}
+        )
+        if not deleted:
             raise HTTPException(status_code=404, detail="Entry not found")
+        await _adjust_tag_counts((), deleted.get("tags") or ())
+        _invalidate_collection_etag()
         return {"message": "Entry deleted successfully"}
     except HTTPException:
         raise
@@ -233,72 +440,82 @@ async def delete_entry(entry_id: str):
         logging.error(f"Error deleting entry: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete entry")
 
-@api_router.get("/mood-trends/weekly", response_model=WeeklyMoodStats)
-async def get_weekly_mood_trends():
+@api_router.get("/mood-trends/weekly")
+async def get_weekly_mood_trends(request: Request):
     """Get mood trends for the past 7 days"""
     try:
-        # Calculate date 7 days ago
+        today = datetime.now(timezone.utc).date()
+        # The 7-day window shifts at midnight, so the day is part of the key
+        etag = await _collection_etag(extra=f":{today.isoformat()}")
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+
+        # Calculate date 7 days ago; the date codec makes this a BSON Date range
         seven_days_ago = (datetime.now(timezone.utc) - timedelta(days=7)).date()
-        
-        # Query entries from the last 7 days
-        entries = await db.journal_entries.find({
-            "date": {"$gte": seven_days_ago.isoformat()},
-            "mood_score": {"$ne": None}
-        }).sort("date", 1).to_list(length=None)
-        
-        if not entries:
-            return WeeklyMoodStats(
+
+        # Compute trends, average/count and modal emotion server-side in one round trip
+        pipeline = [
+            {"$match": {"date": {"$gte": seven_days_ago}, "mood_score": {"$ne": None}}},
+            {"$facet": {
+                "trends": [
+                    {"$sort": {"date": 1}},
+                    {"$project": {"_id": 0, "date": 1, "mood_score": 1, "mood_emotion": 1}}
+                ],
+                "stats": [
+                    {"$group": {"_id": None, "avg": {"$avg": "$mood_score"}, "total": {"$sum": 1}}}
+                ],
+                "mode": [
+                    {"$group": {"_id": "$mood_emotion", "count": {"$sum": 1}}},
+                    {"$sort": {"count": -1}},
+                    {"$limit": 1}
+                ]
+            }}
+        ]
+        cursor = await db.journal_entries.aggregate(pipeline)
+        result = (await cursor.to_list(length=1))[0]
+
+        stats = result["stats"]
+        if not stats:
+            return ORJSONResponse(WeeklyMoodStats(
                 weekly_trends=[],
                 average_mood=5.0,
                 most_common_emotion="neutral",
                 total_entries=0
+            ).model_dump(mode="json"), headers={"ETag": etag})
+
+        trends = [
+            MoodTrendData(
+                date=trend["date"].date().isoformat(),
+                mood_score=trend["mood_score"],
+                mood_emotion=trend["mood_emotion"]
             )
-        
-        # Process trends data
-        trends = []
-        emotions = []
-        total_mood = 0
-        
-        for entry in entries:
-            entry_parsed = parse_from_mongo(entry)
-            trends.append(MoodTrendData(
-                date=entry_parsed["date"].isoformat(),
-                mood_score=entry_parsed["mood_score"],
-                mood_emotion=entry_parsed["mood_emotion"]
-            ))
-            emotions.append(entry_parsed["mood_emotion"])
-            total_mood += entry_parsed["mood_score"]
-        
-        # Calculate stats
-        average_mood = total_mood / len(entries) if entries else 5.0
-        most_common_emotion = max(set(emotions), key=emotions.count) if emotions else "neutral"
-        
-        return WeeklyMoodStats(
+            for trend in result["trends"]
+        ]
+
+        return ORJSONResponse(WeeklyMoodStats(
             weekly_trends=trends,
-            average_mood=round(average_mood, 1),
-            most_common_emotion=most_common_emotion,
-            total_entries=len(entries)
-        )
+            average_mood=round(stats[0]["avg"], 1),
+            most_common_emotion=result["mode"][0]["_id"],
+            total_entries=stats[0]["total"]
+        ).model_dump(mode="json"), headers={"ETag": etag})
         
     except Exception as e:
         logging.error(f"Error fetching mood trends: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch mood trends")
 
 @api_router.get("/tags")
-async def get_all_tags():
+async def get_all_tags(request: Request):
     """Get all unique tags used in entries"""
     try:
-        # Use MongoDB aggregation to get unique tags
-        pipeline = [
-            {"$unwind": "$tags"},
-            {"$group": {"_id": "$tags"}},
-            {"$sort": {"_id": 1}}
-        ]
-        
-        results = await db.journal_entries.aggregate(pipeline).to_list(length=None)
+        etag = await _collection_etag()
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+
+        # Read the precomputed tag counters maintained on the write paths
+        results = await db.tags.find({"count": {"$gt": 0}}).sort("_id", 1).to_list(length=None)
         tags = [result["_id"] for result in results if result["_id"]]
-        
-        return {"tags": tags}
+
+        return ORJSONResponse({"tags": tags}, headers={"ETag": etag})
     except Exception as e:
         logging.error(f"Error fetching tags: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch tags")
@@ -309,7 +526,7 @@ app.include_router(api_router)
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+    allow_origins=CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -321,6 +538,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_db_indexes():
+    """Ensure the indexes backing the list, trends and tags queries exist"""
+    await db.journal_entries.create_index([("created_at", -1)])
+    await db.journal_entries.create_index([("date", 1), ("mood_score", 1)])
+    await db.journal_entries.create_index([("id", 1)], unique=True)
+    await db.journal_entries.create_index([("tags", 1)])
+
+@app.on_event("startup")
+async def migrate_legacy_date_strings():
+    """Convert pre-migration ISO string date fields to BSON Dates
+
+    Old documents stored date/created_at/updated_at as ISO strings; BSON
+    type bracketing would silently exclude them from the Date-typed range
+    match in the weekly trends aggregation.
+    """
+    for field in ("date", "created_at", "updated_at"):
+        await db.journal_entries.update_many(
+            {field: {"$type": "string"}},
+            [{"$set": {field: {"$toDate": f"${field}"}}}],
+        )
+
+@app.on_event("startup")
+async def seed_tag_counters():
+    """Backfill the tags counters from existing entries on first start
+
+    Databases created before the counters existed have entries whose tags
+    were never counted; seed them once from the entries themselves so
+    /api/tags doesn't drop pre-migration tags.
+    """
+    if await db.tags.estimated_document_count():
+        return
+    cursor = await db.journal_entries.aggregate([
+        {"$unwind": "$tags"},
+        {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+    ])
+    ops = [
+        UpdateOne({"_id": doc["_id"]}, {"$setOnInsert": {"count": doc["count"]}}, upsert=True)
+        async for doc in cursor
+    ]
+    if ops:
+        await db.tags.bulk_write(ops, ordered=False)
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
+    await http_client.aclose()
+    await client.close()
@@ -4,138 +4,386 @@ Comprehensive Backend API Testing for Journal App
 Tests all CRUD operations, AI mood analysis, and trend calculations
 """
 
-import requests
+import asyncio
+import collections
+import hashlib
+import httpx
 import json
+import logging
+import orjson
+import os
+import sys
 import time
+import types
 from datetime import datetime, date, timedelta
+from typing import Final
 import uuid
 
 # Configuration
 BASE_URL = "https://moodtracker-journal.preview.emergentagent.com/api"
-HEADERS = {"Content-Type": "application/json"}
+HEADERS = {
+    "Content-Type": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive"
+}
+CACHE_DIR = ".response_cache"
+CATEGORIES = ("crud_operations", "ai_analysis", "mood_trends", "tags_management")
+VERBOSE = "--quiet" not in sys.argv
+
+# Per-endpoint-class (connect, read) timeouts: fast endpoints fail fast,
+# only the AI-backed calls get a long read window
+TIMEOUTS = {
+    "fast": httpx.Timeout(5.0, connect=3.0),
+    "ai": httpx.Timeout(45.0, connect=3.0),
+    "bulk": httpx.Timeout(60.0, connect=3.0)
+}
+
+# Status-based retry policy for transient upstream failures; POST is
+# excluded because entry creation is not idempotent on the server
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+RETRY_BACKOFF = 0.4
+
+# Field sets validated on every response, built once as C-level set ops
+REQUIRED_ENTRY_FIELDS = frozenset({"id", "title", "content", "mood_score", "mood_emotion", "ai_summary", "date", "created_at"})
+REQUIRED_TREND_FIELDS = frozenset({"weekly_trends", "average_mood", "most_common_emotion", "total_entries"})
+TREND_ITEM_FIELDS = frozenset({"date", "mood_score", "mood_emotion"})
+
+# Test entries with different emotional content, built once as immutable
+# views so repeated runs in one process don't re-allocate the fixtures
+TEST_ENTRIES_DATA: Final = tuple(types.MappingProxyType(entry) for entry in (
+    {
+        "title": "Amazing Day at the Beach",
+        "content": "Today was absolutely wonderful! I spent the entire day at the beach with my family. The sun was shining, the waves were perfect, and we had such a great time building sandcastles and swimming. I feel so grateful and happy right now. Life is beautiful!",
+        "tags": ["family", "beach", "vacation"],
+        "expected_emotions": ["happy", "grateful", "excited", "content"]
+    },
+    {
+        "title": "Struggling with Work Stress",
+        "content": "Work has been really overwhelming lately. I have so many deadlines and my boss keeps piling on more tasks. I barely have time to breathe and I'm feeling really anxious about everything. I don't know how I'm going to manage all of this.",
+        "tags": ["work", "stress"],
+        "expected_emotions": ["anxious", "stressed", "sad"]
+    },
+    {
+        "title": "Peaceful Morning Meditation",
+        "content": "I started my day with a 20-minute meditation session in my garden. The birds were chirping softly and there was a gentle breeze. I feel so centered and calm now. It's amazing how a few minutes of mindfulness can completely change my perspective.",
+        "tags": ["meditation", "mindfulness", "morning"],
+        "expected_emotions": ["calm", "content", "grateful"]
+    },
+    {
+        "title": "Exciting Job Interview",
+        "content": "I just finished my interview for the dream job I've been wanting for months! The interviewer seemed really impressed with my portfolio and we had a great conversation about the company's future projects. I'm so excited about the possibility of working there!",
+        "tags": ["career", "interview", "opportunity"],
+        "expected_emotions": ["excited", "happy", "content"]
+    }
+))
+
+UPDATED_TITLE: Final = "Updated: Amazing Day at the Beach"
+UPDATED_CONTENT: Final = (
+    "Updated content: Today was absolutely wonderful! I spent the entire day "
+    "at the beach with my family. The sun was shining, the waves were perfect, "
+    "and we had such a great time building sandcastles and swimming. I feel so "
+    "grateful and happy right now. Life is beautiful! UPDATE: Just got home "
+    "and still feeling amazing!"
+)
+UPDATED_TAGS: Final = ["family", "beach", "vacation", "updated"]
+
+# Request bodies for the fixed fixtures, serialized once at import
+TEST_ENTRY_PAYLOADS = [
+    orjson.dumps({"title": d["title"], "content": d["content"], "tags": d["tags"]})
+    for d in TEST_ENTRIES_DATA
+]
+
+def _json(response):
+    """Parse a response body with orjson instead of the stdlib decoder"""
+    return orjson.loads(response.content)
+
+class _BufferedHandler(logging.StreamHandler):
+    """StreamHandler without the per-record flush (a syscall per line);
+    the driver flushes the handler once after the summary"""
+    def flush(self):
+        pass
+
+logger = logging.getLogger("journal_test")
+logger.setLevel(logging.INFO)
+# Log to stdout like the prints this replaced, so redirecting the run
+# (`python backend_test.py > results.txt`) still captures everything
+_handler = _BufferedHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_handler)
+
+class _ResponseCache:
+    """Record/replay cache for the AI-backed POST/PUT responses
+
+    Controlled by RESPONSE_CACHE_MODE: "record" stores each response on
+    disk keyed by a hash of the request, "replay" serves stored responses
+    without touching the network (the LLM calls dominate run time), and
+    anything else bypasses the cache.
+    """
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        self.mode = os.environ.get("RESPONSE_CACHE_MODE", "bypass")
+
+    def _path(self, method, url, payload):
+        key = hashlib.blake2b(
+            json.dumps([method, url, payload], sort_keys=True).encode(),
+            digest_size=16
+        ).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, method, url, payload):
+        if self.mode != "replay":
+            return None
+        try:
+            with open(self._path(method, url, payload)) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return httpx.Response(cached["status_code"], json=cached["json"])
+
+    def put(self, method, url, payload, response):
+        if self.mode != "record" or not response.is_success:
+            return
+        try:
+            body = response.json()
+        except ValueError:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(method, url, payload), "w") as f:
+            json.dump({"status_code": response.status_code, "json": body}, f)
 
 class JournalAPITester:
+    # Fixed-offset slots instead of a per-instance __dict__; attribute access
+    # on self is on every hot path in the run
+    __slots__ = ("client", "cache", "test_entries", "_rtt", "pass_fail", "details")
+
     def __init__(self):
-        self.base_url = BASE_URL
-        self.headers = HEADERS
+        # One pooled async client reuses connections across all calls and
+        # lets independent requests run concurrently via asyncio.gather
+        self.client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers=HEADERS,
+            timeout=30,
+            transport=httpx.AsyncHTTPTransport(retries=3),
+            limits=httpx.Limits(max_keepalive_connections=8)
+        )
+        self.cache = _ResponseCache()
         self.test_entries = []
-        self.test_results = {
-            "crud_operations": {"passed": 0, "failed": 0, "details": []},
-            "ai_analysis": {"passed": 0, "failed": 0, "details": []},
-            "mood_trends": {"passed": 0, "failed": 0, "details": []},
-            "tags_management": {"passed": 0, "failed": 0, "details": []}
-        }
-    
+        # Per-endpoint round-trip times, used to tighten read timeouts
+        self._rtt = collections.defaultdict(list)
+        # Pass/fail counters and raw detail tuples per category; the summary
+        # strings are only formatted once, in print_summary
+        self.pass_fail = {category: [0, 0] for category in CATEGORIES}
+        self.details = {category: [] for category in CATEGORIES}
+
     def log_result(self, category, test_name, passed, details=""):
         """Log test result"""
-        if passed:
-            self.test_results[category]["passed"] += 1
-            status = "✅ PASS"
-        else:
-            self.test_results[category]["failed"] += 1
-            status = "❌ FAIL"
-        
-        self.test_results[category]["details"].append(f"{status}: {test_name} - {details}")
-        print(f"{status}: {test_name} - {details}")
-    
-    def test_api_health(self):
+        self.pass_fail[category][0 if passed else 1] += 1
+        self.details[category].append((passed, test_name, details))
+        if VERBOSE:
+            status = "✅ PASS" if passed else "❌ FAIL"
+            logger.info(f"{status}: {test_name} - {details}")
+
+    def _timeout(self, endpoint, kind):
+        """Timeout for an endpoint: the class default until 10 samples exist,
+        then tightened to 3x the observed p90 read time"""
+        samples = self._rtt[endpoint]
+        if len(samples) >= 10:
+            p90 = sorted(samples)[int(len(samples) * 0.9) - 1]
+            return httpx.Timeout(max(1.0, 3 * p90), connect=3.0)
+        return TIMEOUTS[kind]
+
+    async def _send(self, method, url, **kwargs):
+        """Send a request, retrying idempotent methods on transient 5xx
+
+        Connection-level retries live on the transport; this layers the
+        status side on top (502/503/504, exponential backoff from 0.4s)
+        so one bad gateway response doesn't fail a whole test.
+        """
+        for attempt in range(3):
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            response = await self.client.request(method, url, **kwargs)
+            if method not in RETRY_METHODS or response.status_code not in RETRY_STATUSES:
+                break
+        return response
+
+    async def _request(self, method, url, *, kind="fast", endpoint=None, **kwargs):
+        """Issue a request with the endpoint's adaptive timeout, recording RTT"""
+        endpoint = endpoint or url
+        start = time.perf_counter()
+        response = await self._send(
+            method, url, timeout=self._timeout(endpoint, kind), **kwargs
+        )
+        self._rtt[endpoint].append(time.perf_counter() - start)
+        return response
+
+    async def _cached_request(self, method, url, json_body, timeout, raw_body=None):
+        """Issue a request through the record/replay cache
+
+        `raw_body` may carry the payload pre-serialized; `json_body` is still
+        used for the cache key either way.
+        """
+        cached = self.cache.get(method, url, json_body)
+        if cached is not None:
+            return cached
+        if raw_body is None:
+            raw_body = orjson.dumps(json_body)
+        response = await self._send(method, url, content=raw_body, timeout=timeout)
+        self.cache.put(method, url, json_body, response)
+        return response
+
+    async def test_api_health(self):
         """Test if API is accessible"""
-        print("\n=== Testing API Health ===")
+        logger.info("\n=== Testing API Health ===")
         try:
-            response = requests.get(f"{self.base_url}/", timeout=10)
+            response = await self._request("GET", "/")
             if response.status_code == 200:
-                print("✅ API is accessible")
+                encoding = response.headers.get("Content-Encoding", "none")
+                logger.info(f"✅ API is accessible (Content-Encoding: {encoding})")
                 return True
             else:
-                print(f"❌ API returned status code: {response.status_code}")
+                logger.info(f"❌ API returned status code: {response.status_code}")
                 return False
         except Exception as e:
-            print(f"❌ API connection failed: {e}")
+            logger.info(f"❌ API connection failed: {e}")
             return False
-    
-    def test_create_entry(self, title, content, tags=None, expected_emotions=None):
+
+    async def test_create_entry(self, title, content, tags=None, expected_emotions=None, raw_body=None):
         """Test creating a journal entry with AI analysis"""
         if tags is None:
             tags = []
-        
+
         entry_data = {
             "title": title,
             "content": content,
             "tags": tags
         }
-        
+
         try:
-            response = requests.post(f"{self.base_url}/entries", 
-                                   json=entry_data, 
-                                   headers=self.headers,
-                                   timeout=30)
-            
-            if response.status_code == 200:
-                entry = response.json()
-                
-                # Validate response structure
-                required_fields = ["id", "title", "content", "mood_score", "mood_emotion", "ai_summary", "date", "created_at"]
-                missing_fields = [field for field in required_fields if field not in entry]
-                
-                if missing_fields:
-                    self.log_result("crud_operations", f"Create Entry '{title}'", False, 
-                                  f"Missing fields: {missing_fields}")
-                    return None
-                
-                # Validate AI analysis
-                mood_score = entry.get("mood_score")
-                mood_emotion = entry.get("mood_emotion")
-                ai_summary = entry.get("ai_summary")
-                
-                ai_valid = True
-                ai_details = []
-                
-                if not isinstance(mood_score, int) or not (1 <= mood_score <= 10):
-                    ai_valid = False
-                    ai_details.append(f"Invalid mood_score: {mood_score}")
-                
-                if not mood_emotion or mood_emotion == "Analysis temporarily unavailable":
-                    ai_valid = False
-                    ai_details.append(f"Invalid mood_emotion: {mood_emotion}")
-                
-                if not ai_summary or ai_summary == "Analysis temporarily unavailable":
-                    ai_valid = False
-                    ai_details.append(f"Invalid ai_summary: {ai_summary}")
-                
-                # Log results
-                self.log_result("crud_operations", f"Create Entry '{title}'", True, 
-                              f"Entry created with ID: {entry['id']}")
-                
-                if ai_valid:
-                    self.log_result("ai_analysis", f"AI Analysis for '{title}'", True,
-                                  f"Score: {mood_score}, Emotion: {mood_emotion}")
-                else:
-                    self.log_result("ai_analysis", f"AI Analysis for '{title}'", False,
-                                  f"Issues: {'; '.join(ai_details)}")
-                
-                # Check expected emotions if provided
-                if expected_emotions and mood_emotion not in expected_emotions:
-                    self.log_result("ai_analysis", f"Expected Emotion for '{title}'", False,
-                                  f"Got '{mood_emotion}', expected one of {expected_emotions}")
-                
-                self.test_entries.append(entry)
-                return entry
+            response = await self._cached_request("POST", "/entries", entry_data, TIMEOUTS["ai"], raw_body=raw_body)
+
+            if response.status_code in (429, 503):
+                # Honor the server's pacing instead of a blanket sleep
+                await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+                response = await self._cached_request("POST", "/entries", entry_data, TIMEOUTS["ai"], raw_body=raw_body)
+
+            if response.status_code in (200, 201):
+                return self._validate_created_entry(_json(response), title, expected_emotions)
             else:
                 self.log_result("crud_operations", f"Create Entry '{title}'", False,
                               f"HTTP {response.status_code}: {response.text}")
                 return None
-                
+
         except Exception as e:
             self.log_result("crud_operations", f"Create Entry '{title}'", False, str(e))
             return None
-    
-    def test_get_entries(self):
+
+    def _validate_created_entry(self, entry, title, expected_emotions=None):
+        """Validate a created-entry record from the single or bulk create path"""
+        # Validate response structure
+        missing_fields = REQUIRED_ENTRY_FIELDS - entry.keys()
+
+        if missing_fields:
+            self.log_result("crud_operations", f"Create Entry '{title}'", False,
+                          f"Missing fields: {sorted(missing_fields)}")
+            return None
+
+        # Validate AI analysis
+        mood_score = entry.get("mood_score")
+        mood_emotion = entry.get("mood_emotion")
+        ai_summary = entry.get("ai_summary")
+
+        ai_valid = True
+        ai_details = []
+
+        if not isinstance(mood_score, int) or not (1 <= mood_score <= 10):
+            ai_valid = False
+            ai_details.append(f"Invalid mood_score: {mood_score}")
+
+        if not mood_emotion or mood_emotion == "Analysis temporarily unavailable":
+            ai_valid = False
+            ai_details.append(f"Invalid mood_emotion: {mood_emotion}")
+
+        if not ai_summary or ai_summary == "Analysis temporarily unavailable":
+            ai_valid = False
+            ai_details.append(f"Invalid ai_summary: {ai_summary}")
+
+        # Log results
+        self.log_result("crud_operations", f"Create Entry '{title}'", True,
+                      f"Entry created with ID: {entry['id']}")
+
+        if ai_valid:
+            self.log_result("ai_analysis", f"AI Analysis for '{title}'", True,
+                          f"Score: {mood_score}, Emotion: {mood_emotion}")
+        else:
+            self.log_result("ai_analysis", f"AI Analysis for '{title}'", False,
+                          f"Issues: {'; '.join(ai_details)}")
+
+        # Check expected emotions if provided
+        if expected_emotions and mood_emotion not in expected_emotions:
+            self.log_result("ai_analysis", f"Expected Emotion for '{title}'", False,
+                          f"Got '{mood_emotion}', expected one of {expected_emotions}")
+
+        self.test_entries.append(entry)
+        return entry
+
+    async def test_bulk_create_entries(self, entries_data):
+        """Test creating all entries in one bulk request
+
+        Falls back to concurrent per-entry POSTs when the server doesn't
+        expose the bulk endpoint, so the client stays compatible.
+        """
+        payload = [
+            {"title": d["title"], "content": d["content"], "tags": d["tags"]}
+            for d in entries_data
+        ]
+
+        try:
+            response = await self._cached_request("POST", "/entries/bulk", payload, TIMEOUTS["bulk"])
+        except Exception as e:
+            self.log_result("crud_operations", "Bulk Create Entries", False, str(e))
+            return None
+
+        if response.status_code in (404, 405):
+            # Reuse the pre-serialized bodies when running the stock fixtures
+            raw_bodies = TEST_ENTRY_PAYLOADS if entries_data is TEST_ENTRIES_DATA else [None] * len(entries_data)
+            results = await asyncio.gather(*[
+                self.test_create_entry(
+                    d["title"], d["content"], d["tags"], d["expected_emotions"],
+                    raw_body=raw_body
+                )
+                for d, raw_body in zip(entries_data, raw_bodies)
+            ])
+            return [entry for entry in results if entry]
+
+        if response.status_code in (200, 201):
+            created = _json(response)
+            if not isinstance(created, list) or len(created) != len(entries_data):
+                self.log_result("crud_operations", "Bulk Create Entries", False,
+                              f"Expected {len(entries_data)} entries in response")
+                return None
+
+            self.log_result("crud_operations", "Bulk Create Entries", True,
+                          f"Created {len(created)} entries in one request")
+            validated = [
+                self._validate_created_entry(entry, d["title"], d["expected_emotions"])
+                for entry, d in zip(created, entries_data)
+            ]
+            return [entry for entry in validated if entry]
+
+        self.log_result("crud_operations", "Bulk Create Entries", False,
+                      f"HTTP {response.status_code}: {response.text}")
+        return None
+
+    async def test_get_entries(self):
         """Test fetching all entries"""
         try:
-            response = requests.get(f"{self.base_url}/entries", timeout=10)
-            
+            response = await self._request("GET", "/entries")
+
             if response.status_code == 200:
-                entries = response.json()
+                entries = _json(response)
                 if isinstance(entries, list):
                     self.log_result("crud_operations", "Get All Entries", True,
                                   f"Retrieved {len(entries)} entries")
@@ -148,18 +396,18 @@ class JournalAPITester:
                 self.log_result("crud_operations", "Get All Entries", False,
                               f"HTTP {response.status_code}: {response.text}")
                 return None
-                
+
         except Exception as e:
             self.log_result("crud_operations", "Get All Entries", False, str(e))
             return None
-    
-    def test_get_entry_by_id(self, entry_id):
+
+    async def test_get_entry_by_id(self, entry_id):
         """Test fetching a specific entry"""
         try:
-            response = requests.get(f"{self.base_url}/entries/{entry_id}", timeout=10)
-            
+            response = await self._request("GET", f"/entries/{entry_id}", endpoint="/entries/{id}")
+
             if response.status_code == 200:
-                entry = response.json()
+                entry = _json(response)
                 if entry.get("id") == entry_id:
                     self.log_result("crud_operations", f"Get Entry by ID", True,
                                   f"Retrieved entry: {entry['title']}")
@@ -176,38 +424,35 @@ class JournalAPITester:
                 self.log_result("crud_operations", f"Get Entry by ID", False,
                               f"HTTP {response.status_code}: {response.text}")
                 return None
-                
+
         except Exception as e:
             self.log_result("crud_operations", f"Get Entry by ID", False, str(e))
             return None
-    
-    def test_update_entry(self, entry_id, new_title, new_content, new_tags=None):
+
+    async def test_update_entry(self, entry_id, new_title, new_content, new_tags=None):
         """Test updating an entry"""
         if new_tags is None:
             new_tags = []
-        
+
         update_data = {
             "title": new_title,
             "content": new_content,
             "tags": new_tags
         }
-        
+
         try:
-            response = requests.put(f"{self.base_url}/entries/{entry_id}",
-                                  json=update_data,
-                                  headers=self.headers,
-                                  timeout=30)
-            
+            response = await self._cached_request("PUT", f"/entries/{entry_id}", update_data, TIMEOUTS["ai"])
+
             if response.status_code == 200:
-                updated_entry = response.json()
-                
+                updated_entry = _json(response)
+
                 # Verify update
-                if (updated_entry.get("title") == new_title and 
+                if (updated_entry.get("title") == new_title and
                     updated_entry.get("content") == new_content):
-                    
+
                     self.log_result("crud_operations", "Update Entry", True,
                                   f"Entry updated successfully")
-                    
+
                     # Check if AI re-analysis happened
                     if updated_entry.get("mood_score") and updated_entry.get("mood_emotion"):
                         self.log_result("ai_analysis", "Re-analysis on Update", True,
@@ -215,7 +460,7 @@ class JournalAPITester:
                     else:
                         self.log_result("ai_analysis", "Re-analysis on Update", False,
                                       "AI analysis not performed on update")
-                    
+
                     return updated_entry
                 else:
                     self.log_result("crud_operations", "Update Entry", False,
@@ -225,16 +470,16 @@ class JournalAPITester:
                 self.log_result("crud_operations", "Update Entry", False,
                               f"HTTP {response.status_code}: {response.text}")
                 return None
-                
+
         except Exception as e:
             self.log_result("crud_operations", "Update Entry", False, str(e))
             return None
-    
-    def test_delete_entry(self, entry_id):
+
+    async def test_delete_entry(self, entry_id):
         """Test deleting an entry"""
         try:
-            response = requests.delete(f"{self.base_url}/entries/{entry_id}", timeout=10)
-            
+            response = await self._request("DELETE", f"/entries/{entry_id}", endpoint="/entries/{id}")
+
             if response.status_code == 200:
                 self.log_result("crud_operations", "Delete Entry", True,
                               "Entry deleted successfully")
@@ -247,74 +492,73 @@ class JournalAPITester:
                 self.log_result("crud_operations", "Delete Entry", False,
                               f"HTTP {response.status_code}: {response.text}")
                 return False
-                
+
         except Exception as e:
             self.log_result("crud_operations", "Delete Entry", False, str(e))
             return False
-    
-    def test_weekly_mood_trends(self):
+
+    async def test_weekly_mood_trends(self):
         """Test weekly mood trends API"""
         try:
-            response = requests.get(f"{self.base_url}/mood-trends/weekly", timeout=10)
-            
+            response = await self._request("GET", "/mood-trends/weekly")
+
             if response.status_code == 200:
-                trends = response.json()
-                
+                trends = _json(response)
+
                 # Validate structure
-                required_fields = ["weekly_trends", "average_mood", "most_common_emotion", "total_entries"]
-                missing_fields = [field for field in required_fields if field not in trends]
-                
+                missing_fields = REQUIRED_TREND_FIELDS - trends.keys()
+
                 if missing_fields:
                     self.log_result("mood_trends", "Weekly Trends Structure", False,
-                                  f"Missing fields: {missing_fields}")
+                                  f"Missing fields: {sorted(missing_fields)}")
                     return None
-                
+
                 # Validate data types
                 if not isinstance(trends["weekly_trends"], list):
                     self.log_result("mood_trends", "Weekly Trends Data", False,
                                   "weekly_trends is not a list")
                     return None
-                
+
                 if not isinstance(trends["average_mood"], (int, float)):
                     self.log_result("mood_trends", "Average Mood Type", False,
                                   f"average_mood is not numeric: {type(trends['average_mood'])}")
                     return None
-                
+
                 if not isinstance(trends["total_entries"], int):
                     self.log_result("mood_trends", "Total Entries Type", False,
                                   f"total_entries is not int: {type(trends['total_entries'])}")
                     return None
-                
+
                 self.log_result("mood_trends", "Weekly Trends API", True,
                               f"Retrieved trends for {trends['total_entries']} entries, avg mood: {trends['average_mood']}")
-                
+
                 # Validate trend data structure
                 for i, trend in enumerate(trends["weekly_trends"]):
-                    if not all(key in trend for key in ["date", "mood_score", "mood_emotion"]):
+                    if not TREND_ITEM_FIELDS.issubset(trend):
                         self.log_result("mood_trends", f"Trend Item {i}", False,
                                       "Missing required fields in trend item")
                     else:
                         self.log_result("mood_trends", f"Trend Item {i}", True,
                                       f"Valid trend: {trend['date']} - {trend['mood_emotion']}")
-                
+
                 return trends
             else:
                 self.log_result("mood_trends", "Weekly Trends API", False,
                               f"HTTP {response.status_code}: {response.text}")
                 return None
-                
+
         except Exception as e:
             self.log_result("mood_trends", "Weekly Trends API", False, str(e))
             return None
-    
-    def test_tags_management(self):
+
+    async def test_tags_management(self):
         """Test tags management API"""
         try:
-            response = requests.get(f"{self.base_url}/tags", timeout=10)
-            
+            response = await self._request("GET", "/tags")
+
             if response.status_code == 200:
-                tags_response = response.json()
-                
+                tags_response = _json(response)
+
                 if "tags" in tags_response and isinstance(tags_response["tags"], list):
                     tags = tags_response["tags"]
                     self.log_result("tags_management", "Get All Tags", True,
@@ -328,128 +572,92 @@ class JournalAPITester:
                 self.log_result("tags_management", "Get All Tags", False,
                               f"HTTP {response.status_code}: {response.text}")
                 return None
-                
+
         except Exception as e:
             self.log_result("tags_management", "Get All Tags", False, str(e))
             return None
-    
-    def run_comprehensive_tests(self):
-        """Run all tests in sequence"""
-        print("🚀 Starting Comprehensive Journal App Backend Testing")
-        print("=" * 60)
-        
-        # Test API health first
-        if not self.test_api_health():
-            print("❌ API is not accessible. Stopping tests.")
-            return
-        
-        print("\n=== Testing Journal Entry CRUD Operations ===")
-        
-        # Test creating entries with different emotional content
-        test_entries_data = [
-            {
-                "title": "Amazing Day at the Beach",
-                "content": "Today was absolutely wonderful! I spent the entire day at the beach with my family. The sun was shining, the waves were perfect, and we had such a great time building sandcastles and swimming. I feel so grateful and happy right now. Life is beautiful!",
-                "tags": ["family", "beach", "vacation"],
-                "expected_emotions": ["happy", "grateful", "excited", "content"]
-            },
-            {
-                "title": "Struggling with Work Stress",
-                "content": "Work has been really overwhelming lately. I have so many deadlines and my boss keeps piling on more tasks. I barely have time to breathe and I'm feeling really anxious about everything. I don't know how I'm going to manage all of this.",
-                "tags": ["work", "stress"],
-                "expected_emotions": ["anxious", "stressed", "sad"]
-            },
-            {
-                "title": "Peaceful Morning Meditation",
-                "content": "I started my day with a 20-minute meditation session in my garden. The birds were chirping softly and there was a gentle breeze. I feel so centered and calm now. It's amazing how a few minutes of mindfulness can completely change my perspective.",
-                "tags": ["meditation", "mindfulness", "morning"],
-                "expected_emotions": ["calm", "content", "grateful"]
-            },
-            {
-                "title": "Exciting Job Interview",
-                "content": "I just finished my interview for the dream job I've been wanting for months! The interviewer seemed really impressed with my portfolio and we had a great conversation about the company's future projects. I'm so excited about the possibility of working there!",
-                "tags": ["career", "interview", "opportunity"],
-                "expected_emotions": ["excited", "happy", "content"]
-            }
-        ]
-        
-        # Create test entries
-        created_entries = []
-        for entry_data in test_entries_data:
-            entry = self.test_create_entry(
-                entry_data["title"],
-                entry_data["content"],
-                entry_data["tags"],
-                entry_data["expected_emotions"]
-            )
-            if entry:
-                created_entries.append(entry)
-            time.sleep(2)  # Brief pause between AI calls
-        
-        # Test getting all entries
-        all_entries = self.test_get_entries()
-        
-        # Test getting specific entries
-        if created_entries:
-            self.test_get_entry_by_id(created_entries[0]["id"])
-            
+
+    async def run_comprehensive_tests(self):
+        """Run all tests, fanning out independent calls concurrently"""
+        try:
+            logger.info("🚀 Starting Comprehensive Journal App Backend Testing")
+            logger.info("=" * 60)
+
+            # Test API health first
+            if not await self.test_api_health():
+                logger.info("❌ API is not accessible. Stopping tests.")
+                return
+
+            logger.info("\n=== Testing Journal Entry CRUD Operations ===")
+
+            # One bulk request creates all four entries (falling back to
+            # concurrent per-entry POSTs on servers without the endpoint)
+            created_entries = await self.test_bulk_create_entries(TEST_ENTRIES_DATA) or []
+
             # Test updating an entry
-            updated_entry = self.test_update_entry(
-                created_entries[0]["id"],
-                "Updated: Amazing Day at the Beach",
-                "Updated content: Today was absolutely wonderful! I spent the entire day at the beach with my family. The sun was shining, the waves were perfect, and we had such a great time building sandcastles and swimming. I feel so grateful and happy right now. Life is beautiful! UPDATE: Just got home and still feeling amazing!",
-                ["family", "beach", "vacation", "updated"]
-            )
-        
-        # Test getting non-existent entry
-        self.test_get_entry_by_id("non-existent-id")
-        
-        print("\n=== Testing Weekly Mood Trends ===")
-        self.test_weekly_mood_trends()
-        
-        print("\n=== Testing Tags Management ===")
-        self.test_tags_management()
-        
-        # Clean up - delete test entries (except one for trend testing)
-        print("\n=== Cleaning Up Test Data ===")
-        if created_entries:
-            for i, entry in enumerate(created_entries[1:], 1):  # Keep first entry
-                self.test_delete_entry(entry["id"])
-        
-        # Test deleting non-existent entry
-        self.test_delete_entry("non-existent-id")
-        
-        self.print_summary()
-    
+            if created_entries:
+                await self.test_update_entry(
+                    created_entries[0]["id"], UPDATED_TITLE, UPDATED_CONTENT, UPDATED_TAGS
+                )
+
+            # The remaining verification reads are independent GETs, so fan
+            # them out over the pooled client instead of paying 5 RTTs serially
+            logger.info("\n=== Testing Reads, Mood Trends and Tags ===")
+            read_checks = [
+                self.test_get_entries(),
+                self.test_get_entry_by_id("non-existent-id"),
+                self.test_weekly_mood_trends(),
+                self.test_tags_management(),
+            ]
+            if created_entries:
+                read_checks.insert(1, self.test_get_entry_by_id(created_entries[0]["id"]))
+            await asyncio.gather(*read_checks)
+
+            # Clean up - delete test entries concurrently (except one for trend testing)
+            logger.info("\n=== Cleaning Up Test Data ===")
+            if created_entries:
+                await asyncio.gather(*(
+                    self.test_delete_entry(entry["id"]) for entry in created_entries[1:]
+                ))
+
+            # Test deleting non-existent entry
+            await self.test_delete_entry("non-existent-id")
+
+            self.print_summary()
+        finally:
+            await self.client.aclose()
+
     def print_summary(self):
         """Print test summary"""
-        print("\n" + "=" * 60)
-        print("📊 TEST SUMMARY")
-        print("=" * 60)
-        
+        logger.info("\n" + "=" * 60)
+        logger.info("📊 TEST SUMMARY")
+        logger.info("=" * 60)
+
         total_passed = 0
         total_failed = 0
-        
-        for category, results in self.test_results.items():
-            passed = results["passed"]
-            failed = results["failed"]
+
+        for category in CATEGORIES:
+            passed, failed = self.pass_fail[category]
             total_passed += passed
             total_failed += failed
-            
+
             status = "✅" if failed == 0 else "❌"
-            print(f"\n{status} {category.upper().replace('_', ' ')}: {passed} passed, {failed} failed")
-            
-            if results["details"]:
-                for detail in results["details"]:
-                    print(f"  {detail}")
-        
-        print(f"\n🎯 OVERALL RESULTS: {total_passed} passed, {total_failed} failed")
-        
+            logger.info(f"\n{status} {category.upper().replace('_', ' ')}: {passed} passed, {failed} failed")
+
+            for item_passed, test_name, details in self.details[category]:
+                item_status = "✅ PASS" if item_passed else "❌ FAIL"
+                logger.info(f"  {item_status}: {test_name} - {details}")
+
+        logger.info(f"\n🎯 OVERALL RESULTS: {total_passed} passed, {total_failed} failed")
+
         if total_failed == 0:
-            print("🎉 ALL TESTS PASSED!")
+            logger.info("🎉 ALL TESTS PASSED!")
         else:
-            print(f"⚠️  {total_failed} TESTS FAILED - Review details above")
+            logger.info(f"⚠️  {total_failed} TESTS FAILED - Review details above")
+
+        # The buffered handler suppresses per-record flushes; drain it once here
+        logging.StreamHandler.flush(_handler)
 
 if __name__ == "__main__":
     tester = JournalAPITester()
-    tester.run_comprehensive_tests()
\ No newline at end of file
+    asyncio.run(tester.run_comprehensive_tests())